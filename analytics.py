@@ -0,0 +1,318 @@
+from collections import Counter, deque
+from multiprocessing import Pool
+from typing import NamedTuple
+from array import array
+import argparse
+import json
+import os
+import sys
+
+from walls import WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT, unpack_walls, find_path
+
+# Number of bytes of a JSONL file analyzed per worker task. A chunk always ends at the end of a
+# line, so it can exceed this by up to one line.
+CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class MazeStats(NamedTuple):
+    """
+    Difficulty metrics of a single maze. Lengths of paths are counted in steps between cells.
+
+    Attributes:
+        rows (int): The number of rows in the maze.
+        cols (int): The number of columns in the maze.
+        solution_length (int): The number of steps from the entrance to the exit, -1 if there is no path.
+        dead_ends (int): The number of cells with a single opening.
+        junctions (int): The number of cells with three or four openings.
+        branching_factor (float): The average number of ways forward when entering a cell that is not a dead end.
+        corridor_lengths (dict): How many corridors (runs of cells with exactly two openings) there are of each length.
+        diameter (int): The number of steps of the longest shortest path between two cells.
+    """
+    rows: int
+    cols: int
+    solution_length: int
+    dead_ends: int
+    junctions: int
+    branching_factor: float
+    corridor_lengths: dict
+    diameter: int
+
+
+def _open_neighbours(masks, num_rows: int, num_cols: int, k: int) -> list:
+    """Returns the indices of the cells reachable from cell k in one step."""
+    mask = masks[k]
+    i, j = k % num_cols, k // num_cols
+    neighbours = []
+    if j > 0 and not mask & WALL_TOP:
+        neighbours.append(k - num_cols)
+    if j < num_rows - 1 and not mask & WALL_BOTTOM:
+        neighbours.append(k + num_cols)
+    if i > 0 and not mask & WALL_LEFT:
+        neighbours.append(k - 1)
+    if i < num_cols - 1 and not mask & WALL_RIGHT:
+        neighbours.append(k + 1)
+    return neighbours
+
+
+def _farthest(masks, num_rows: int, num_cols: int, start: int) -> tuple:
+    """
+    Runs a breadth-first search from cell start.
+
+    Returns:
+        tuple: (cell, distance) of the cell farthest from start.
+    """
+    distance = array("l", [-1]) * (num_rows * num_cols)
+    distance[start] = 0
+    queue = deque([start])
+    k = start
+    while queue:
+        k = queue.popleft()
+        for n in _open_neighbours(masks, num_rows, num_cols, k):
+            if distance[n] < 0:
+                distance[n] = distance[k] + 1
+                queue.append(n)
+    # Breadth-first search dequeues cells in order of distance, so the last one is the farthest
+    return k, distance[k]
+
+
+def analyze(masks, num_rows: int, num_cols: int) -> MazeStats:
+    """
+    Computes the difficulty metrics of a maze in time linear in its number of cells.
+
+    Openings in the outer wall (the entrance and exit) do not count as openings of a cell.
+    The diameter is measured within the part of the maze connected to the entrance.
+
+    Args:
+        masks (bytes): The wall masks, row by row. Any buffer works, including shared memory.
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+
+    Returns:
+        MazeStats: The metrics of the maze.
+    """
+    num_cells = num_rows * num_cols
+    if len(masks) != num_cells:
+        raise ValueError(f"expected {num_cells} wall masks, got {len(masks)}")
+
+    degree = bytearray(num_cells)
+    for k in range(num_cells):
+        degree[k] = len(_open_neighbours(masks, num_rows, num_cols, k))
+
+    dead_ends = degree.count(1)
+    junctions = degree.count(3) + degree.count(4)
+    choices = [d - 1 for d in degree if d >= 2]
+    branching_factor = sum(choices) / len(choices) if choices else 0.0
+
+    # Measure every corridor once, walking outwards from its first unseen cell
+    corridor_lengths = Counter()
+    seen = bytearray(num_cells)
+    for k in range(num_cells):
+        if degree[k] != 2 or seen[k]:
+            continue
+        seen[k] = 1
+        length = 1
+        stack = [k]
+        while stack:
+            for n in _open_neighbours(masks, num_rows, num_cols, stack.pop()):
+                if degree[n] == 2 and not seen[n]:
+                    seen[n] = 1
+                    length += 1
+                    stack.append(n)
+        corridor_lengths[length] += 1
+
+    path = find_path(masks, num_rows, num_cols, (0, 0), (num_cols - 1, num_rows - 1))
+
+    # In a tree the cell farthest from any cell is one end of a longest path
+    far_end, _ = _farthest(masks, num_rows, num_cols, 0)
+    _, diameter = _farthest(masks, num_rows, num_cols, far_end)
+
+    return MazeStats(
+        rows=num_rows,
+        cols=num_cols,
+        solution_length=len(path) - 1,
+        dead_ends=dead_ends,
+        junctions=junctions,
+        branching_factor=branching_factor,
+        corridor_lengths=dict(sorted(corridor_lengths.items())),
+        diameter=diameter,
+    )
+
+
+def analyze_maze(maze) -> MazeStats:
+    """Computes the difficulty metrics of a generated Maze."""
+    return analyze(maze._walls, maze._num_rows, maze._num_cols)
+
+
+def _is_dimension(value) -> bool:
+    """Returns whether value is a usable number of rows or columns."""
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 1
+
+
+def _maze_from_record(record) -> tuple:
+    """
+    Reads a maze from a JSONL record written by main.py.
+
+    Returns:
+        tuple: (num_rows, num_cols, masks), or None if the record does not hold a maze.
+    """
+    if not isinstance(record, dict) or not {"rows", "cols", "walls"} <= record.keys():
+        return None
+    if not _is_dimension(record["rows"]) or not _is_dimension(record["cols"]):
+        return None
+    try:
+        masks = bytes(mask for row in record["walls"] for mask in row)
+    except (TypeError, ValueError):
+        return None
+    if len(masks) != record["rows"] * record["cols"]:
+        return None
+    return record["rows"], record["cols"], masks
+
+
+def plan_tasks(file_path: str):
+    """
+    Splits a saved maze file into units of work for analyze_task.
+
+    A packed .bin file is one task. A .jsonl file is split into runs of whole lines of about
+    CHUNK_BYTES bytes each, given as byte ranges. The planner reads the file once to find line
+    boundaries and count lines, while parsing and analyzing the mazes is left to the workers.
+    A .jsonl file whose first line is not a maze (for example metrics written by this module)
+    is skipped.
+
+    Yields:
+        tuple: (file_path, start, end, first_line) where start and end are byte offsets.
+    """
+    if file_path.endswith(".bin"):
+        yield file_path, 0, None, 0
+        return
+
+    with open(file_path, "rb") as jsonl_file:
+        first_line = jsonl_file.readline()
+        try:
+            is_maze_file = _maze_from_record(json.loads(first_line)) is not None
+        except ValueError:
+            is_maze_file = False
+        if not is_maze_file:
+            print(f"Skipping {file_path}: not a maze file", file=sys.stderr)
+            return
+
+        jsonl_file.seek(0)
+        start, end, line_number, lines = 0, 0, 1, 0
+        for line in jsonl_file:
+            lines += 1
+            end += len(line)
+            if end - start >= CHUNK_BYTES:
+                yield file_path, start, end, line_number
+                start, line_number, lines = end, line_number + lines, 0
+        if lines:
+            yield file_path, start, end, line_number
+
+
+def analyze_task(task: tuple) -> tuple:
+    """
+    Computes the metrics of the mazes in one task planned by plan_tasks.
+
+    Returns:
+        tuple: (results, skipped) where results holds one (source, MazeStats) pair per maze and
+               skipped names the entries that are not mazes. A source is the file name, followed
+               by the line number for JSONL.
+    """
+    file_path, start, end, first_line = task
+    results, skipped = [], []
+
+    if end is None:
+        with open(file_path, "rb") as binary_file:
+            try:
+                num_rows, num_cols, masks = unpack_walls(binary_file.read())
+            except ValueError:
+                return results, [file_path]
+        if not _is_dimension(num_rows) or not _is_dimension(num_cols):
+            return results, [file_path]
+        return [(file_path, analyze(masks, num_rows, num_cols))], skipped
+
+    with open(file_path, "rb") as jsonl_file:
+        jsonl_file.seek(start)
+        position, line_number = start, first_line
+        # Read one line at a time, so a worker holds a single maze record rather than its whole chunk
+        while position < end:
+            line = jsonl_file.readline()
+            position += len(line)
+            source = f"{file_path}:{line_number}"
+            line_number += 1
+            if not line.strip():
+                continue
+            try:
+                maze = _maze_from_record(json.loads(line))
+            except ValueError:
+                maze = None
+            if maze is None:
+                skipped.append(source)
+            else:
+                results.append((source, analyze(maze[2], maze[0], maze[1])))
+    return results, skipped
+
+
+def find_maze_files(directory: str) -> list:
+    """Lists the .bin and .jsonl files in a directory and its subdirectories, in a stable order."""
+    found = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file_name in sorted(files):
+            if file_name.endswith((".bin", ".jsonl")):
+                found.append(os.path.join(root, file_name))
+    return found
+
+
+def analyze_directory(directory: str, workers: int = 1):
+    """
+    Computes the metrics of every saved maze in a directory.
+
+    Large JSONL files are split into chunks of about CHUNK_BYTES bytes, so every worker has
+    work even when a whole batch was saved to a single file. Entries that are not mazes are reported on
+    standard error and skipped.
+
+    Args:
+        directory (str): The directory to search for .bin and .jsonl files.
+        workers (int, optional): Number of worker processes. Defaults to 1.
+
+    Yields:
+        tuple: (source, MazeStats) for each maze, as soon as its chunk has been analyzed.
+    """
+    tasks = (task for file_path in find_maze_files(directory) for task in plan_tasks(file_path))
+    pool = None
+    if workers > 1:
+        pool = Pool(workers)
+        task_results = pool.imap_unordered(analyze_task, tasks)
+    else:
+        task_results = map(analyze_task, tasks)
+    try:
+        for results, skipped in task_results:
+            for source in skipped:
+                print(f"Skipping {source}: not a maze", file=sys.stderr)
+            yield from results
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+
+def main(argv: list = None) -> None:
+    """Writes the metrics of every saved maze in the given directories as JSON lines."""
+    parser = argparse.ArgumentParser(description="Compute difficulty metrics of saved mazes.")
+    parser.add_argument("directories", nargs="+", help="directories holding .bin or .jsonl maze files")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--output", default="-", help="file to write the metrics to (default: standard output)")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for directory in args.directories:
+            for source, stats in analyze_directory(directory, args.workers):
+                record = {"source": source, **stats._asdict()}
+                output.write(json.dumps(record, separators=(",", ":")) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+from typing import NamedTuple
+
+
+class Point(NamedTuple):
+    """
+    Represents a point in 2D space with x and y coordinates.
+
+    Attributes:
+        x (int): The x-coordinate of the point in pixels.
+        y (int): The y-coordinate of the point in pixels.
+
+    Notes:
+        - x=0 refers to the left side of the screen.
+        - y=0 refers to the top of the screen.
+    """
+    x: int
+    y: int
+
+
+class Cell:
+    """
+    The Cell class holds the wall state of a single cell in the maze.
+    It has no geometry and cannot be drawn, see graphics.Cell for that.
+
+    Attributes:
+        has_left_wall (bool): Whether the left wall exists.
+        has_right_wall (bool): Whether the right wall exists.
+        has_top_wall (bool): Whether the top wall exists.
+        has_bottom_wall (bool): Whether the bottom wall exists.
+    """
+    __slots__ = ("has_left_wall", "has_right_wall", "has_top_wall", "has_bottom_wall")
+
+    def __init__(self) -> None:
+        """Initializes a cell with all four walls standing."""
+        self.has_left_wall: bool = True
+        self.has_right_wall: bool = True
+        self.has_top_wall: bool = True
+        self.has_bottom_wall: bool = True
+
+    def draw(self) -> None:
+        """Does nothing: a cell without a window has nothing to draw on."""
+
+    def draw_move(self, to_cell: 'Cell', undo: bool = False) -> None:
+        """Does nothing: a cell without a window has nothing to draw on."""
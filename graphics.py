@@ -1,22 +1,12 @@
-from tkinter import Tk, Canvas, BOTH
-from PIL import Image, ImageTk
+from typing import TYPE_CHECKING
 import time
 
-class Point:
-    """
-    Represents a point in 2D space with x and y coordinates.
-    
-    Attributes:
-        x (int): The x-coordinate of the point in pixels.
-        y (int): The y-coordinate of the point in pixels.
-    
-    Notes:
-        - x=0 refers to the left side of the screen.
-        - y=0 refers to the top of the screen.
-    """
-    def __init__(self, x: int, y: int) -> None:
-        self.x: int = x
-        self.y: int = y
+from core import Point, Cell as CellState
+
+# tkinter and Pillow are imported when a Window is created, so that headless code
+# importing this module (or the Point class re-exported from core) does not pay for them
+if TYPE_CHECKING:
+    from tkinter import Canvas
 
 
 class Line:
@@ -31,7 +21,7 @@ class Line:
         self.start_point: Point = start_point
         self.end_point: Point = end_point
 
-    def draw(self, canvas: Canvas, fill_color: str) -> None:
+    def draw(self, canvas: 'Canvas', fill_color: str) -> None:
         """
         Draws the line on the provided canvas using the specified color.
         
@@ -73,6 +63,9 @@ class Window:
         height (int): Height of the window in pixels.
         background_image_path (str, optional): Path to the background image. Defaults to None.
         """
+        from tkinter import Tk, Canvas, BOTH
+        from PIL import Image, ImageTk
+
         self.width: int = width
         self.height: int = height
         self.__root_widget = Tk()
@@ -102,6 +95,8 @@ class Window:
 
     def load_sprite_images(self) -> None:
         """Loads and resizes the sprite images for Link and Zelda."""
+        from PIL import Image, ImageTk
+
         # Load Link's sprite
         sprite_path_link = "images/link_sprite.gif"
         self.sprite_image_link = Image.open(sprite_path_link)
@@ -170,10 +165,10 @@ class Window:
 
 
 
-class Cell:
+class Cell(CellState):
     """
-    The Cell class represents a single cell in the maze. 
-    It manages the walls of the cell, tracks visited status, and handles sprite movement.
+    The Cell class represents a single cell in the maze that is drawn in a window.
+    It adds the geometry of the cell and the drawing of walls and sprite movement to the wall state from core.Cell.
 
     Attributes:
         top_left (Point): The top-left corner of the cell.
@@ -184,7 +179,6 @@ class Cell:
         has_right_wall (bool): Whether the right wall exists.
         has_top_wall (bool): Whether the top wall exists.
         has_bottom_wall (bool): Whether the bottom wall exists.
-        visited (bool): Marks whether the cell has been visited during maze solving.
     """
     def __init__(self, top_left: Point, bottom_right: Point, window: Window = None) -> None:
         """
@@ -195,13 +189,9 @@ class Cell:
         bottom_right (Point): The bottom-right corner of the cell.
         window (Window, optional): The window where the maze will be drawn. Defaults to None.
         """
-        self.has_left_wall: bool = True
-        self.has_right_wall: bool = True
-        self.has_top_wall: bool = True
-        self.has_bottom_wall: bool = True
+        super().__init__()
         self.top_left: Point = top_left
         self._win: Window = window
-        self.visited: bool = False
 
         # Store line IDs for each wall (helps in deleting them later if needed)
         self.left_wall_id = None
@@ -294,6 +284,9 @@ class Cell:
         to_cell (Cell): The destination cell where the sprite will move.
         undo (bool): Whether this is an undo operation (reverting the move). Defaults to False.
         """
+        if self._win is None:
+            return
+
         line_to_draw = Line(self.middle, to_cell.middle)
         move_color = "#FFD700"  # Triforce gold for movement lines
 
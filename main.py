@@ -1,20 +1,227 @@
-from graphics import Point, Window
-from maze import Maze
+from multiprocessing import Pool
+import argparse
+import json
+import os
+import random
 import sys
 
-def main() -> None:
+from core import Point
+from maze import Maze, GENERATORS, SOLVERS, DEFAULT_GENERATOR, DEFAULT_SOLVER
+from walls import walls_to_rows, pack_walls, pack_path, MAX_DIMENSION
+
+# Size of one maze cell in rendered PNG images, in pixels
+PNG_CELL_SIZE = 16
+PNG_MARGIN = 8
+
+
+def parse_size(value: str) -> tuple:
     """
-    Main function to initialize and run the Maze Solver.
-    It creates a window, generates a maze, and attempts to solve it.
+    Parses a maze size given as ROWSxCOLS.
 
-    Parameters:
-    None
+    Args:
+        value (str): The size, e.g. "12x16".
 
     Returns:
-    None
+        tuple: (num_rows, num_cols).
+    """
+    try:
+        num_rows, num_cols = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}, expected ROWSxCOLS")
+    if num_rows < 1 or num_cols < 1:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}, rows and columns must be positive")
+    if num_rows > MAX_DIMENSION or num_cols > MAX_DIMENSION:
+        raise argparse.ArgumentTypeError(f"invalid size {value!r}, rows and columns must be at most {MAX_DIMENSION}")
+    return num_rows, num_cols
+
+
+def parse_args(argv: list = None) -> argparse.Namespace:
+    """Parses the command line of the maze solver."""
+    parser = argparse.ArgumentParser(description="Generate and solve mazes, in a window or in bulk.")
+    parser.add_argument("--size", dest="sizes", type=parse_size, action="append", metavar="ROWSxCOLS",
+                        help="maze size, may be repeated (default: 12x16)")
+    parser.add_argument("--count", type=int, default=1, help="number of mazes to generate per size")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="seed of the first maze, the following mazes use seed+1, seed+2, ...")
+    parser.add_argument("--generator", choices=sorted(GENERATORS), default=DEFAULT_GENERATOR, help="maze generation algorithm")
+    parser.add_argument("--solver", choices=sorted(SOLVERS), default=DEFAULT_SOLVER, help="maze solving algorithm")
+    parser.add_argument("--render", choices=("none", "png", "tk"), default="tk",
+                        help="animate in a window (tk), write PNG images (png) or only write results (none)")
+    parser.add_argument("--format", choices=("jsonl", "binary"), default="jsonl",
+                        help="write results to mazes.jsonl or to one packed .bin file per maze")
+    parser.add_argument("--output-dir", default="output", help="directory to write results to")
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    args = parser.parse_args(argv)
+
+    if args.sizes is None:
+        args.sizes = [(12, 16)]
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.render == "tk" and (args.count > 1 or len(args.sizes) > 1):
+        parser.error("--render tk shows a single maze, use --render none or png for batches")
+    return args
+
+
+def _set_recursion_limit(num_cells: int) -> None:
+    """Raises the recursion limit so generating and solving a maze of num_cells cells cannot overflow it."""
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), num_cells + 1000))
+
+
+def make_jobs(args: argparse.Namespace) -> list:
+    """
+    Lists one job per maze to generate.
+
+    Every job gets its own seed, so each maze in the results can be reproduced on its own.
+    """
+    base_seed = random.randrange(2 ** 32) if args.seed is None else args.seed
+    jobs = []
+    for num_rows, num_cols in args.sizes:
+        for _ in range(args.count):
+            jobs.append({
+                "index": len(jobs),
+                "rows": num_rows,
+                "cols": num_cols,
+                "seed": base_seed + len(jobs),
+                "generator": args.generator,
+                "solver": args.solver,
+                "render": args.render,
+                "output_dir": args.output_dir,
+            })
+    return jobs
+
+
+def run_job(job: dict) -> dict:
+    """
+    Generates and solves one maze without a window.
+
+    Args:
+        job (dict): The job, as produced by make_jobs.
+
+    Returns:
+        dict: The job with the wall masks ("walls") and the solution ("path") added.
+    """
+    num_rows, num_cols = job["rows"], job["cols"]
+    _set_recursion_limit(num_rows * num_cols)
+    maze = GENERATORS[job["generator"]](num_rows, num_cols, job["seed"])
+    result = dict(job)
+    result["walls"] = maze._walls
+    result["path"] = SOLVERS[job["solver"]](maze, (0, 0), (num_cols - 1, num_rows - 1))
+    if job["render"] == "png":
+        render_png(os.path.join(job["output_dir"], f"maze_{job['index']:06d}.png"),
+                   num_rows, num_cols, result["walls"], result["path"])
+    return result
+
+
+def render_png(file_path: str, num_rows: int, num_cols: int, masks, path: list) -> None:
+    """
+    Draws a maze and its solution into a PNG image.
+
+    Args:
+        file_path (str): Where to save the image.
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        masks (bytes): The wall masks, row by row.
+        path (list): The (i, j) cells of the solution.
+    """
+    from PIL import Image, ImageDraw
+    from walls import WALL_TOP, WALL_RIGHT, WALL_BOTTOM, WALL_LEFT
+
+    size = PNG_CELL_SIZE
+    image = Image.new("RGB", (num_cols * size + 2 * PNG_MARGIN, num_rows * size + 2 * PNG_MARGIN), "white")
+    draw = ImageDraw.Draw(image)
+    wall_color = "#8B4513"
+
+    for j in range(num_rows):
+        for i in range(num_cols):
+            mask = masks[j * num_cols + i]
+            x1, y1 = PNG_MARGIN + i * size, PNG_MARGIN + j * size
+            x2, y2 = x1 + size, y1 + size
+            if mask & WALL_TOP:
+                draw.line((x1, y1, x2, y1), fill=wall_color, width=2)
+            if mask & WALL_RIGHT:
+                draw.line((x2, y1, x2, y2), fill=wall_color, width=2)
+            if mask & WALL_BOTTOM:
+                draw.line((x1, y2, x2, y2), fill=wall_color, width=2)
+            if mask & WALL_LEFT:
+                draw.line((x1, y1, x1, y2), fill=wall_color, width=2)
+
+    # Draw the solution through the cell midpoints in triforce gold
+    if len(path) > 1:
+        points = [(PNG_MARGIN + i * size + size // 2, PNG_MARGIN + j * size + size // 2) for i, j in path]
+        draw.line(points, fill="#FFD700", width=2)
+
+    image.save(file_path)
+
+
+def run_batch(args: argparse.Namespace) -> int:
+    """
+    Generates and solves every maze of the batch, writing each result as soon as it is finished.
+
+    Returns:
+        int: The number of mazes written.
+    """
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = make_jobs(args)
+    _set_recursion_limit(max(job["rows"] * job["cols"] for job in jobs))
+
+    pool = None
+    if args.workers > 1:
+        pool = Pool(args.workers)
+        results = pool.imap_unordered(run_job, jobs)
+    else:
+        results = map(run_job, jobs)
+
+    jsonl_file = None
+    if args.format == "jsonl":
+        jsonl_file = open(os.path.join(args.output_dir, "mazes.jsonl"), "w")
+
+    written = 0
+    try:
+        for result in results:
+            if jsonl_file is not None:
+                record = {
+                    "index": result["index"],
+                    "rows": result["rows"],
+                    "cols": result["cols"],
+                    "seed": result["seed"],
+                    "generator": result["generator"],
+                    "solver": result["solver"],
+                    "walls": walls_to_rows(result["rows"], result["cols"], result["walls"]),
+                    "path": [list(cell) for cell in result["path"]],
+                }
+                jsonl_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                jsonl_file.flush()
+            else:
+                file_path = os.path.join(args.output_dir, f"maze_{result['index']:06d}.bin")
+                with open(file_path, "wb") as binary_file:
+                    binary_file.write(pack_walls(result["rows"], result["cols"], result["walls"]))
+                    binary_file.write(pack_path(result["path"]))
+            written += 1
+    except BaseException:
+        # Stop the workers right away instead of letting them finish jobs nobody will write
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+        raise
+    else:
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if jsonl_file is not None:
+            jsonl_file.close()
+    return written
+
+
+def run_window(args: argparse.Namespace) -> None:
+    """
+    Creates a window, generates a maze, and animates solving it.
     """
-    num_rows: int = 12
-    num_cols: int = 16
+    from graphics import Window
+
+    num_rows, num_cols = args.sizes[0]
     window_width: int = 800  # Total width of the window
     window_height: int = 600  # Total height of the window
 
@@ -37,18 +244,18 @@ def main() -> None:
     background_image_path: str = "images/background.png"
 
     # Increase the recursion limit to handle deep recursion for large mazes
-    sys.setrecursionlimit(10000)
+    _set_recursion_limit(num_rows * num_cols)
 
     # Create the window with the background image
     win: Window = Window(window_width, window_height, background_image_path)
 
     # Create and solve the maze
-    maze: Maze = Maze(margin_point, num_rows, num_cols, cell_width, cell_height, win)
+    maze: Maze = Maze(margin_point, num_rows, num_cols, cell_width, cell_height, win, seed=args.seed)
     print("Maze created")
 
     # Solve the maze starting from the top-left corner
     maze_solved: bool = maze.solve(0, 0)
-    
+
     if not maze_solved:
         print("Maze cannot be solved!")
     else:
@@ -57,10 +264,24 @@ def main() -> None:
     # Keep the window open until manually closed
     win.wait_for_close()
 
-if __name__ == "__main__":
-    main()
-
 
+def main(argv: list = None) -> None:
+    """
+    Main function of the Maze Solver.
+    Either animates a single maze in a window, or generates and solves a batch of mazes headless.
 
+    Parameters:
+    argv (list, optional): The command line arguments. Defaults to sys.argv.
 
+    Returns:
+    None
+    """
+    args = parse_args(argv)
+    if args.render == "tk":
+        run_window(args)
+    else:
+        written = run_batch(args)
+        print(f"Wrote {written} mazes to {args.output_dir}")
 
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,10 @@
-from graphics import Cell, Point
+from core import Cell, Point
 import time
 import random
 
+from walls import encode_walls, find_path
+
+
 class Maze:
     """
     The Maze class manages the creation, drawing, and solving of a maze.
@@ -15,6 +18,9 @@ class Maze:
         _cell_size_y (int): The height of each cell.
         _win (Window): The window object to draw the maze on.
         _cells (list): A 2D list holding the maze's cells.
+        _walls (bytearray): The wall masks of all cells, row by row (see walls.py).
+
+    Once created the maze is never modified (see walls.find_path for concurrent solving).
     """
     
     def __init__(self, top_left: Point, num_rows: int, num_cols: int, 
@@ -49,14 +55,22 @@ class Maze:
         self._cells = []
         self._create_cells()
         self._break_entrance_and_exit()
-        self._break_walls_r(0, 0)
-        self._reset_cells_visited()
+        self._break_walls_r(0, 0, bytearray(num_rows * num_cols))
+        self._walls = encode_walls(self)
 
     def _create_cells(self) -> None:
         """
         Populates the maze with cells based on the number of rows and columns. 
-        Each cell is initialized with its top-left and bottom-right coordinates.
+        Without a window the cells only hold their walls; with a window each cell
+        is initialized with its top-left and bottom-right coordinates so it can be drawn.
         """
+        if self._win is None:
+            self._cells = [[Cell() for _ in range(self._num_rows)] for _ in range(self._num_cols)]
+            return
+
+        # Only drawing needs graphics (and with it tkinter and Pillow)
+        from graphics import Cell as DrawableCell
+
         for i in range(self._num_cols):
             col_cells = []
             for j in range(self._num_rows):
@@ -69,7 +83,7 @@ class Maze:
                 # Create the cell and append it to the column list
                 top_left = Point(top_left_x, top_left_y)
                 bottom_right = Point(bottom_right_x, bottom_right_y)
-                cell = Cell(top_left, bottom_right, self._win)
+                cell = DrawableCell(top_left, bottom_right, self._win)
                 col_cells.append(cell)
             # Add the column of cells to the main cell list
             self._cells.append(col_cells)
@@ -125,27 +139,32 @@ class Maze:
             midpoint_y = (exit_cell.bottom_left.y + exit_cell.bottom_right.y) // 2
             self._win.create_zelda_sprite(midpoint_x, midpoint_y + 15)
 
-    def _break_walls_r(self, i: int, j: int) -> None:
+    def _cell_index(self, i: int, j: int) -> int:
+        """Returns the index of cell (i, j) in flat per-cell arrays, row by row like _walls."""
+        return j * self._num_cols + i
+
+    def _break_walls_r(self, i: int, j: int, visited: bytearray) -> None:
         """
         Recursively breaks walls using depth-first traversal.
 
         Args:
             i (int): The column index of the current cell.
             j (int): The row index of the current cell.
+            visited (bytearray): One flag per cell, set once the cell has been reached.
         """
         current_cell = self._cells[i][j]
-        current_cell.visited = True
+        visited[self._cell_index(i, j)] = 1
 
         while True:
             to_visit = []
             # Check all valid neighboring cells that haven't been visited
-            if j > 0 and not self._cells[i][j - 1].visited:
+            if j > 0 and not visited[self._cell_index(i, j - 1)]:
                 to_visit.append(("up", i, j - 1))
-            if j < self._num_rows - 1 and not self._cells[i][j + 1].visited:
+            if j < self._num_rows - 1 and not visited[self._cell_index(i, j + 1)]:
                 to_visit.append(("down", i, j + 1))
-            if i > 0 and not self._cells[i - 1][j].visited:
+            if i > 0 and not visited[self._cell_index(i - 1, j)]:
                 to_visit.append(("left", i - 1, j))
-            if i < self._num_cols - 1 and not self._cells[i + 1][j].visited:
+            if i < self._num_cols - 1 and not visited[self._cell_index(i + 1, j)]:
                 to_visit.append(("right", i + 1, j))
 
             if len(to_visit) == 0:
@@ -168,13 +187,7 @@ class Maze:
                 current_cell.has_right_wall = False
                 self._cells[ni][nj].has_left_wall = False
 
-            self._break_walls_r(ni, nj)
-
-    def _reset_cells_visited(self) -> None:
-        """Resets the visited status of all cells."""
-        for col in self._cells:
-            for cell in col:
-                cell.visited = False
+            self._break_walls_r(ni, nj, visited)
 
     def solve(self, i: int, j: int) -> bool:
         """
@@ -187,15 +200,30 @@ class Maze:
         Returns:
             bool: True if the maze is solved, False otherwise.
         """
-        return self._solve_r(i, j)
+        return self._solve_r(i, j, bytearray(self._num_rows * self._num_cols))
 
-    def _solve_r(self, i: int, j: int) -> bool:
+    def find_path(self, start: tuple, end: tuple) -> list:
+        """
+        Finds the path between two cells of the maze.
+
+        Args:
+            start (tuple): The (i, j) coordinates of the first cell.
+            end (tuple): The (i, j) coordinates of the last cell.
+
+        Returns:
+            list: The (i, j) coordinates of every cell on the path, from start to end.
+                  Empty if the cells are not connected.
+        """
+        return find_path(self._walls, self._num_rows, self._num_cols, start, end)
+
+    def _solve_r(self, i: int, j: int, visited: bytearray) -> bool:
         """
         Recursively solves the maze using depth-first search.
 
         Args:
             i (int): The column index of the current cell.
             j (int): The row index of the current cell.
+            visited (bytearray): One flag per cell, set once this solve has reached the cell.
 
         Returns:
             bool: True if the maze is solved, False otherwise.
@@ -207,7 +235,7 @@ class Maze:
         current_cell = self._cells[i][j]
         
         # Mark this cell as visited to avoid revisiting it
-        current_cell.visited = True
+        visited[self._cell_index(i, j)] = 1
 
         # Check if the current cell is the exit (bottom-right corner of the maze)
         if i == self._num_cols - 1 and j == self._num_rows - 1:
@@ -226,12 +254,12 @@ class Maze:
         # Iterate over each direction (up, down, left, right)
         for direction, ni, nj, valid in directions:
             # Check if the direction is valid (i.e., no wall) and if the target cell is within maze bounds and not visited
-            if valid and 0 <= ni < self._num_cols and 0 <= nj < self._num_rows and not self._cells[ni][nj].visited:
+            if valid and 0 <= ni < self._num_cols and 0 <= nj < self._num_rows and not visited[self._cell_index(ni, nj)]:
                 # Move to the neighboring cell and visually draw the movement
                 current_cell.draw_move(self._cells[ni][nj])
 
                 # Recursively attempt to solve the maze from the neighboring cell
-                if self._solve_r(ni, nj):
+                if self._solve_r(ni, nj, visited):
                     # If a solution is found, return True (to propagate the success back through the recursion)
                     return True
                 else:
@@ -242,5 +270,33 @@ class Maze:
         return False
 
 
+def generate_dfs(num_rows: int, num_cols: int, seed: int = None) -> Maze:
+    """
+    Generates a maze without a window, breaking walls with a randomized depth-first traversal.
+
+    Args:
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        seed (int, optional): Seed for randomizing the maze generation. Defaults to None.
+
+    Returns:
+        Maze: The generated maze.
+    """
+    return Maze(Point(0, 0), num_rows, num_cols, 1, 1, seed=seed)
+
+
+def solve_dfs(maze: Maze, start: tuple, end: tuple) -> list:
+    """
+    Finds the path between two cells of a maze with a depth-first search.
+
+    Returns:
+        list: The (i, j) coordinates of every cell on the path, from start to end.
+    """
+    return maze.find_path(start, end)
 
 
+# Maze generation and solving algorithms by name, as offered by main.py and server.py
+GENERATORS = {"dfs": generate_dfs}
+SOLVERS = {"dfs": solve_dfs}
+DEFAULT_GENERATOR = "dfs"
+DEFAULT_SOLVER = "dfs"
@@ -0,0 +1,397 @@
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from multiprocessing import Pool
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import json
+import math
+import os
+import queue
+import random
+import sys
+import threading
+import time
+
+from maze import GENERATORS, DEFAULT_GENERATOR
+from walls import walls_to_rows, pack_walls, pack_path
+
+# Largest number of rows or columns a single request may ask for
+MAX_REQUEST_DIMENSION = 500
+
+# How long a request waits for its maze before giving up, in seconds. A pool worker that
+# dies (out of memory, killed by a signal) loses its tasks without any error being reported.
+REQUEST_TIMEOUT = 30.0
+
+JSON_CONTENT_TYPE = "application/json"
+BINARY_CONTENT_TYPE = "application/octet-stream"
+
+
+def _init_worker() -> None:
+    """Prepares a pool worker: maze generation and solving recurse once per cell."""
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), MAX_REQUEST_DIMENSION * MAX_REQUEST_DIMENSION + 1000))
+
+
+def _run_job(job: dict) -> tuple:
+    """
+    Generates (and optionally solves) one maze and renders the response body.
+
+    Args:
+        job (dict): The validated request parameters, see parse_params.
+
+    Returns:
+        tuple: (content_type, body) of the response.
+    """
+    num_rows, num_cols = job["rows"], job["cols"]
+    maze = GENERATORS[job["algorithm"]](num_rows, num_cols, job["seed"])
+    masks = maze._walls
+    path = None
+    if job["kind"] == "solve":
+        path = maze.find_path(job["start"], job["end"])
+
+    if job["format"] == "binary":
+        body = pack_walls(num_rows, num_cols, masks)
+        if path is not None:
+            body += pack_path(path)
+        return BINARY_CONTENT_TYPE, body
+
+    result = {
+        "rows": num_rows,
+        "cols": num_cols,
+        "seed": job["seed"],
+        "algorithm": job["algorithm"],
+        "walls": walls_to_rows(num_rows, num_cols, masks),
+    }
+    if path is not None:
+        result["start"] = list(job["start"])
+        result["end"] = list(job["end"])
+        result["path"] = [list(cell) for cell in path]
+    return JSON_CONTENT_TYPE, json.dumps(result, separators=(",", ":")).encode()
+
+
+def _run_batch(jobs: list) -> list:
+    """
+    Runs a batch of jobs inside a pool worker.
+
+    Returns:
+        list: One (ok, value) pair per job, where value is the response or an error message.
+    """
+    results = []
+    for job in jobs:
+        try:
+            results.append((True, _run_job(job)))
+        except Exception as error:
+            results.append((False, f"{type(error).__name__}: {error}"))
+    return results
+
+
+def _parse_int(value, name: str) -> int:
+    """
+    Parses an integer parameter, given as a string in a query string or as a JSON number.
+    Floats and booleans are refused rather than silently truncated.
+    """
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    elif isinstance(value, int) and not isinstance(value, bool):
+        return value
+    raise ValueError(f"{name} must be an integer")
+
+
+def _parse_cell(value, name: str) -> tuple:
+    """Parses a cell given either as "i,j" or as a two-item list."""
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        raise ValueError(f"{name} must be two integers i,j")
+    return _parse_int(value[0], name), _parse_int(value[1], name)
+
+
+def parse_params(kind: str, params: dict) -> dict:
+    """
+    Validates the parameters of a generate or solve request.
+
+    Args:
+        kind (str): Either "generate" or "solve".
+        params (dict): The raw parameters from the query string or JSON body.
+
+    Returns:
+        dict: The job to hand to the worker pool.
+
+    Raises:
+        ValueError: If a parameter is missing or invalid.
+    """
+    try:
+        num_rows = _parse_int(params["rows"], "rows")
+        num_cols = _parse_int(params["cols"], "cols")
+    except KeyError as error:
+        raise ValueError(f"missing parameter {error.args[0]}")
+    if not (1 <= num_rows <= MAX_REQUEST_DIMENSION and 1 <= num_cols <= MAX_REQUEST_DIMENSION):
+        raise ValueError(f"rows and cols must be between 1 and {MAX_REQUEST_DIMENSION}")
+
+    seed = params.get("seed")
+    seed = random.randrange(2 ** 32) if seed is None else _parse_int(seed, "seed")
+
+    algorithm = params.get("algorithm", DEFAULT_GENERATOR)
+    if algorithm not in GENERATORS:
+        raise ValueError(f"unknown algorithm {algorithm!r}, expected one of {', '.join(sorted(GENERATORS))}")
+
+    output_format = params.get("format", "json")
+    if output_format not in ("json", "binary"):
+        raise ValueError("format must be json or binary")
+
+    job = {
+        "kind": kind,
+        "rows": num_rows,
+        "cols": num_cols,
+        "seed": seed,
+        "algorithm": algorithm,
+        "format": output_format,
+    }
+    if kind == "solve":
+        job["start"] = _parse_cell(params.get("start", (0, 0)), "start")
+        job["end"] = _parse_cell(params.get("end", (num_cols - 1, num_rows - 1)), "end")
+        for i, j in (job["start"], job["end"]):
+            if not (0 <= i < num_cols and 0 <= j < num_rows):
+                raise ValueError(f"cell ({i}, {j}) is outside the maze")
+    return job
+
+
+class Batcher:
+    """
+    Collects concurrent jobs into micro-batches and runs each batch on the worker pool.
+
+    The first job of a batch waits at most batch_window seconds for others to join.
+    The batch is then split into one chunk per worker, so a burst of requests costs
+    one round trip per worker instead of one per request and still runs in parallel.
+
+    Attributes:
+        workers (int): The number of worker processes in the pool.
+        batch_window (float): How long to wait for more jobs after the first one, in seconds.
+        max_batch (int): The largest number of jobs sent to the pool at once.
+    """
+
+    def __init__(self, pool, workers: int, batch_window: float = 0.005, max_batch: int = 32) -> None:
+        """
+        Starts the background thread that dispatches batches.
+
+        Args:
+            pool (Pool): The worker pool that runs the batches.
+            workers (int): The number of worker processes in the pool.
+            batch_window (float, optional): Seconds to wait for a batch to fill. Defaults to 0.005.
+            max_batch (int, optional): Maximum number of jobs per batch. Defaults to 32.
+        """
+        self._pool = pool
+        self.workers = workers
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._dispatch, name="maze-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: dict) -> Future:
+        """Queues a job and returns a future that resolves to its (content_type, body)."""
+        future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def close(self) -> None:
+        """Stops the dispatch thread once the queued jobs have been sent to the pool."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _dispatch(self) -> None:
+        """Groups queued jobs into batches until close is called."""
+        running = True
+        while running:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    running = False
+                    break
+                batch.append(item)
+            self._send(batch)
+
+    def _send(self, batch: list) -> None:
+        """Spreads one batch over the pool workers, one chunk per worker."""
+        chunk_size = math.ceil(len(batch) / self.workers)
+        for start in range(0, len(batch), chunk_size):
+            self._send_chunk(batch[start:start + chunk_size])
+
+    def _send_chunk(self, chunk: list) -> None:
+        """Runs a chunk of jobs in one pool worker and resolves their futures."""
+        futures = [future for _, future in chunk]
+
+        def on_result(results: list) -> None:
+            for future, (ok, value) in zip(futures, results):
+                if ok:
+                    future.set_result(value)
+                else:
+                    future.set_exception(RuntimeError(value))
+
+        def on_error(error: BaseException) -> None:
+            for future in futures:
+                future.set_exception(error)
+
+        self._pool.apply_async(_run_batch, ([job for job, _ in chunk],),
+                               callback=on_result, error_callback=on_error)
+
+
+class MazeRequestHandler(BaseHTTPRequestHandler):
+    """
+    Serves the maze endpoints:
+
+        GET/POST /generate  rows, cols, seed, algorithm, format
+        GET/POST /solve     the same, plus start and end cells given as i,j
+
+    GET requests take their parameters from the query string, POST requests from a JSON object.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        self._handle(url.path, params)
+
+    def do_POST(self) -> None:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # The body cannot be skipped reliably, so the connection cannot be reused either
+            self.close_connection = True
+            self._send_error(400, "Content-Length must be a non-negative integer")
+            return
+        try:
+            params = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send_error(400, "request body is not valid JSON")
+            return
+        if not isinstance(params, dict):
+            self._send_error(400, "request body must be a JSON object")
+            return
+        self._handle(urlsplit(self.path).path, params)
+
+    def _handle(self, route: str, params: dict) -> None:
+        """Validates the request, waits for its batch to finish and writes the response."""
+        kind = route.strip("/")
+        if kind not in ("generate", "solve"):
+            self._send_error(404, f"unknown endpoint {route}")
+            return
+        try:
+            job = parse_params(kind, params)
+        except (ValueError, TypeError) as error:
+            self._send_error(400, str(error))
+            return
+        try:
+            content_type, body = self.server.batcher.submit(job).result(timeout=self.server.request_timeout)
+        except FutureTimeoutError:
+            self._send_error(503, f"no result within {self.server.request_timeout:g} seconds")
+            return
+        except Exception as error:
+            self._send_error(500, str(error))
+            return
+        self._send(200, content_type, body)
+
+    def _send_error(self, status: int, message: str) -> None:
+        self._send(status, JSON_CONTENT_TYPE, json.dumps({"error": message}).encode())
+
+    def _send(self, status: int, content_type: str, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class MazeServer(ThreadingHTTPServer):
+    """
+    HTTP server that generates and solves mazes on a pool of worker processes.
+
+    The pool is forked before the server starts accepting connections,
+    so requests never wait for a worker to start up.
+
+    Attributes:
+        pool (Pool): The worker processes.
+        batcher (Batcher): Groups concurrent requests into batches for the pool.
+        quiet (bool): Whether to suppress the per-request log lines.
+        request_timeout (float): Seconds a request waits for its result before failing with 503.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, workers: int = None, batch_window: float = 0.005,
+                 max_batch: int = 32, quiet: bool = False, request_timeout: float = REQUEST_TIMEOUT) -> None:
+        """
+        Forks the worker pool and binds the server.
+
+        Args:
+            address (tuple): The (host, port) to listen on.
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            batch_window (float, optional): Seconds to wait for a batch to fill. Defaults to 0.005.
+            max_batch (int, optional): Maximum number of requests per batch. Defaults to 32.
+            quiet (bool, optional): Suppress per-request logging. Defaults to False.
+            request_timeout (float, optional): Seconds to wait for a result. Defaults to REQUEST_TIMEOUT.
+        """
+        workers = workers or os.cpu_count()
+        self.pool = Pool(workers, initializer=_init_worker)
+        self.batcher = Batcher(self.pool, workers, batch_window, max_batch)
+        self.quiet = quiet
+        self.request_timeout = request_timeout
+        super().__init__(address, MazeRequestHandler)
+
+    def server_close(self) -> None:
+        """Closes the socket, then stops the batcher and the worker pool."""
+        super().server_close()
+        self.batcher.close()
+        self.pool.terminate()
+        self.pool.join()
+
+
+def main() -> None:
+    """Runs the maze server until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve maze generation and solving over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0,
+                        help="how long a request waits for others to batch with")
+    parser.add_argument("--max-batch", type=int, default=32, help="maximum requests per batch")
+    parser.add_argument("--quiet", action="store_true", help="do not log every request")
+    parser.add_argument("--request-timeout", type=float, default=REQUEST_TIMEOUT,
+                        help="seconds a request waits for its maze before failing with 503")
+    args = parser.parse_args()
+
+    server = MazeServer((args.host, args.port), args.workers, args.batch_window_ms / 1000,
+                        args.max_batch, args.quiet, args.request_timeout)
+    print(f"Serving mazes on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+from multiprocessing import shared_memory, resource_tracker
+from contextlib import contextmanager
+from typing import NamedTuple
+import struct
+import sys
+import threading
+
+from walls import pack_walls, unpack_walls, find_path, MAX_DIMENSION
+
+# Header at the start of every segment: magic, number of rows, number of columns.
+# The wall masks follow, one byte per cell, row by row (the layout of Maze._walls).
+MAGIC = b"MS"
+_HEADER = struct.Struct(">2sHH")
+
+# Before Python 3.13 attaching to a segment registers it with the resource tracker,
+# which then deletes it when the attaching process exits, even though another process owns it
+_CAN_SKIP_TRACKING = sys.version_info >= (3, 13)
+_tracker_lock = threading.Lock()
+
+
+@contextmanager
+def _untracked(name: str):
+    """
+    Keeps the resource tracker from registering the segment name while attaching to it.
+
+    Registering and then unregistering is not enough: forked and spawned workers share the
+    owner's tracker, which keeps a set of names rather than a count, so concurrent attaches
+    would drop the owner's registration and make the tracker fail on the extra unregister.
+    """
+    with _tracker_lock:
+        register = resource_tracker.register
+
+        def register_others(resource_name: str, rtype: str) -> None:
+            if rtype != "shared_memory" or resource_name.lstrip("/") != name.lstrip("/"):
+                register(resource_name, rtype)
+
+        resource_tracker.register = register_others
+        try:
+            yield
+        finally:
+            resource_tracker.register = register
+
+
+class MazeHandle(NamedTuple):
+    """
+    A small, picklable reference to a maze stored in shared memory.
+    Send it to another process and call attach there to read the maze without copying it.
+
+    Attributes:
+        name (str): The name of the shared memory segment.
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+    """
+    name: str
+    num_rows: int
+    num_cols: int
+
+    def attach(self) -> 'SharedMaze':
+        """Attaches to the maze this handle refers to."""
+        return SharedMaze.attach(self)
+
+
+class SharedMaze:
+    """
+    The wall masks of a maze, stored in a multiprocessing.shared_memory segment.
+
+    The process that creates the segment owns it and must unlink it once every stage
+    of the pipeline is done with it. Other processes attach through a MazeHandle and
+    read the masks in place, so handing a maze over costs the same whatever its size.
+
+    Attributes:
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        walls (memoryview): The wall masks, row by row, directly in shared memory.
+        owner (bool): Whether this process created the segment.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, num_rows: int, num_cols: int, owner: bool) -> None:
+        """
+        Wraps an existing segment. Use create, from_maze, from_packed or attach instead.
+
+        Args:
+            shm (SharedMemory): The segment holding the header and wall masks.
+            num_rows (int): The number of rows in the maze.
+            num_cols (int): The number of columns in the maze.
+            owner (bool): Whether this process created the segment.
+        """
+        self._shm = shm
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.owner = owner
+        self.walls = shm.buf[_HEADER.size:_HEADER.size + num_rows * num_cols]
+
+    @classmethod
+    def create(cls, num_rows: int, num_cols: int, masks=None) -> 'SharedMaze':
+        """
+        Creates a new segment for a maze of the given size.
+
+        Args:
+            num_rows (int): The number of rows in the maze.
+            num_cols (int): The number of columns in the maze.
+            masks (bytes, optional): The wall masks to copy in, row by row. Defaults to all walls standing.
+
+        Returns:
+            SharedMaze: The maze, owned by this process.
+        """
+        if not (1 <= num_rows <= MAX_DIMENSION and 1 <= num_cols <= MAX_DIMENSION):
+            raise ValueError(f"rows and cols must be between 1 and {MAX_DIMENSION}")
+        num_cells = num_rows * num_cols
+        if masks is not None and len(masks) != num_cells:
+            raise ValueError(f"expected {num_cells} wall masks, got {len(masks)}")
+        shm = shared_memory.SharedMemory(create=True, size=_HEADER.size + num_cells)
+        maze = None
+        try:
+            _HEADER.pack_into(shm.buf, 0, MAGIC, num_rows, num_cols)
+            maze = cls(shm, num_rows, num_cols, owner=True)
+            if masks is None:
+                maze.walls[:] = b"\x0f" * num_cells
+            else:
+                maze.walls[:] = masks
+        except Exception:
+            # Never leave an unreachable segment behind in /dev/shm
+            if maze is not None:
+                maze.walls.release()
+            shm.close()
+            shm.unlink()
+            raise
+        return maze
+
+    @classmethod
+    def from_maze(cls, maze) -> 'SharedMaze':
+        """Copies the walls of a generated Maze into a new segment."""
+        return cls.create(maze._num_rows, maze._num_cols, maze._walls)
+
+    @classmethod
+    def from_packed(cls, data: bytes) -> 'SharedMaze':
+        """Copies a maze in the compact binary format (see walls.pack_walls) into a new segment."""
+        num_rows, num_cols, masks = unpack_walls(data)
+        return cls.create(num_rows, num_cols, masks)
+
+    @classmethod
+    def attach(cls, handle) -> 'SharedMaze':
+        """
+        Attaches to a maze created by another process.
+
+        Args:
+            handle (MazeHandle or str): The handle of the maze, or the name of its segment.
+
+        Returns:
+            SharedMaze: A view on the maze that does not own the segment.
+        """
+        name = handle.name if isinstance(handle, MazeHandle) else handle
+        if _CAN_SKIP_TRACKING:
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            with _untracked(name):
+                shm = shared_memory.SharedMemory(name=name)
+        try:
+            magic, num_rows, num_cols = _HEADER.unpack_from(shm.buf)
+            if magic != MAGIC:
+                raise ValueError(f"shared memory segment {name!r} does not hold a maze")
+            if isinstance(handle, MazeHandle) and (num_rows, num_cols) != (handle.num_rows, handle.num_cols):
+                raise ValueError(f"shared memory segment {name!r} holds a maze of a different size")
+        except Exception:
+            shm.close()
+            raise
+        return cls(shm, num_rows, num_cols, owner=False)
+
+    @property
+    def handle(self) -> MazeHandle:
+        """The handle to send to other processes."""
+        return MazeHandle(self._shm.name, self.num_rows, self.num_cols)
+
+    def find_path(self, start: tuple, end: tuple) -> list:
+        """
+        Finds the path between two cells, reading the walls in place.
+
+        Args:
+            start (tuple): The (i, j) coordinates of the first cell.
+            end (tuple): The (i, j) coordinates of the last cell.
+
+        Returns:
+            list: The (i, j) coordinates of every cell on the path, from start to end.
+        """
+        return find_path(self.walls, self.num_rows, self.num_cols, start, end)
+
+    def to_packed(self) -> bytes:
+        """Returns the maze in the compact binary format (see walls.pack_walls)."""
+        return pack_walls(self.num_rows, self.num_cols, self.walls)
+
+    def close(self) -> None:
+        """Detaches this process from the segment. The maze stays available to other processes."""
+        if self.walls is not None:
+            self.walls.release()
+            self.walls = None
+            self._shm.close()
+
+    def unlink(self) -> None:
+        """Frees the segment once all processes have closed it. Only the owner may unlink."""
+        if not self.owner:
+            raise RuntimeError("only the process that created the maze can unlink it")
+        self._shm.unlink()
+
+    def __enter__(self) -> 'SharedMaze':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Closes the maze, and unlinks it if this process owns it."""
+        self.close()
+        if self.owner:
+            self.unlink()
@@ -0,0 +1,140 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout, redirect_stderr
+from unittest.mock import patch
+from analytics import analyze, analyze_maze, analyze_directory, plan_tasks, main as analytics_main
+from core import Point
+from main import main
+from maze import Maze, generate_dfs
+from walls import pack_walls, walls_to_rows
+
+
+# Test cases for the maze analytics
+class TestAnalytics(unittest.TestCase):
+
+    def test_corridor(self):
+        """
+        Test a 1x3 corridor: two dead ends joined by one corridor cell.
+        """
+        stats = analyze(bytes([13, 5, 7]), 1, 3)
+        self.assertEqual(stats.solution_length, 2)
+        self.assertEqual(stats.dead_ends, 2)
+        self.assertEqual(stats.junctions, 0)
+        self.assertEqual(stats.branching_factor, 1.0)
+        self.assertEqual(stats.corridor_lengths, {1: 1})
+        self.assertEqual(stats.diameter, 2)
+        # A single cell is already solved, which differs from having no path at all
+        self.assertEqual(analyze(bytes([15]), 1, 1).solution_length, 0)
+
+    def test_junction(self):
+        """
+        Test a T-shaped passage in a 2x3 grid whose exit is walled off.
+        """
+        stats = analyze(bytes([13, 1, 7, 15, 14, 15]), 2, 3)
+        self.assertEqual(stats.solution_length, -1)
+        self.assertEqual(stats.dead_ends, 3)
+        self.assertEqual(stats.junctions, 1)
+        self.assertEqual(stats.branching_factor, 2.0)
+        self.assertEqual(stats.corridor_lengths, {})
+        self.assertEqual(stats.diameter, 2)
+
+    def test_generated_maze(self):
+        """
+        Test the metrics of a generated maze against properties every perfect maze has.
+        """
+        maze = Maze(Point(0, 0), 30, 40, 10, 10, seed=9)
+        stats = analyze_maze(maze)
+        self.assertEqual(stats.solution_length, len(maze.find_path((0, 0), (39, 29))) - 1)
+        # The solution is a path in the tree, so it cannot be longer than the diameter
+        self.assertLessEqual(stats.solution_length, stats.diameter)
+        self.assertGreater(stats.dead_ends, 0)
+        # Every cell of a connected maze larger than one cell has at least one opening
+        corridor_cells = sum(length * count for length, count in stats.corridor_lengths.items())
+        self.assertLessEqual(stats.dead_ends + stats.junctions + corridor_cells, 30 * 40)
+
+    def test_directory(self):
+        """
+        Test that mazes saved as JSONL and as packed files give the same metrics,
+        and that the command line writes one JSON line per maze.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            for file_format in ("jsonl", "binary"):
+                main(["--size", "8x9", "--count", "3", "--seed", "5", "--render", "none",
+                      "--format", file_format, "--output-dir", os.path.join(output_dir, file_format)])
+            results = dict(analyze_directory(output_dir, workers=2))
+
+            output = io.StringIO()
+            with redirect_stdout(output):
+                analytics_main([output_dir])
+
+        self.assertEqual(len(results), 6)
+        jsonl_stats = sorted((stats for source, stats in results.items() if ".jsonl:" in source), key=repr)
+        binary_stats = sorted((stats for source, stats in results.items() if source.endswith(".bin")), key=repr)
+        self.assertEqual(jsonl_stats, binary_stats)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(len(records), 6)
+        self.assertIn("diameter", records[0])
+
+    def test_jsonl_is_split_into_chunks(self):
+        """
+        Test that one large JSONL file is split by size into chunks of whole lines that workers
+        analyze separately, with every maze still reported once under its own line number.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            main(["--size", "5x5", "--count", "6", "--seed", "1", "--render", "none", "--output-dir", output_dir])
+            jsonl_path = os.path.join(output_dir, "mazes.jsonl")
+            large = generate_dfs(30, 30, seed=1)
+            with open(jsonl_path, "a") as jsonl_file:
+                record = {"rows": 30, "cols": 30, "walls": walls_to_rows(30, 30, large._walls)}
+                jsonl_file.write(json.dumps(record) + "\n")
+            with open(jsonl_path, "rb") as jsonl_file:
+                line_ends = [len(line) for line in jsonl_file]
+            for k in range(1, len(line_ends)):
+                line_ends[k] += line_ends[k - 1]
+            # Three small mazes fill a chunk, the large one takes a chunk of its own
+            with patch("analytics.CHUNK_BYTES", line_ends[2]):
+                tasks = list(plan_tasks(jsonl_path))
+                results = dict(analyze_directory(output_dir, workers=2))
+
+        self.assertEqual([task[3] for task in tasks], [1, 4, 7])
+        self.assertEqual([task[1:3] for task in tasks],
+                         [(0, line_ends[2]), (line_ends[2], line_ends[5]), (line_ends[5], line_ends[6])])
+        self.assertEqual(sorted(results), sorted(f"{jsonl_path}:{line}" for line in range(1, 8)))
+
+    def test_files_that_are_not_mazes_are_skipped(self):
+        """
+        Test that metrics written by a previous run, broken packed files and bad lines are
+        reported and skipped instead of aborting the run.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            main(["--size", "4x4", "--count", "2", "--seed", "3", "--render", "none", "--output-dir", output_dir])
+            with open(os.path.join(output_dir, "mazes.jsonl"), "a") as jsonl_file:
+                jsonl_file.write('{"rows": 2, "cols": 2}\n')
+                jsonl_file.write('{"rows": 0, "cols": 3, "walls": []}\n')
+                jsonl_file.write('{"rows": true, "cols": 1, "walls": [[15]]}\n')
+            with open(os.path.join(output_dir, "broken.bin"), "wb") as binary_file:
+                binary_file.write(b"not a maze")
+            with open(os.path.join(output_dir, "empty.bin"), "wb") as binary_file:
+                binary_file.write(pack_walls(0, 5, b""))
+            with redirect_stdout(io.StringIO()):
+                analytics_main([output_dir, "--output", os.path.join(output_dir, "stats.jsonl")])
+
+            errors = io.StringIO()
+            with redirect_stderr(errors):
+                results = dict(analyze_directory(output_dir))
+
+        self.assertEqual(len(results), 2)
+        self.assertIn("stats.jsonl: not a maze file", errors.getvalue())
+        self.assertIn("broken.bin: not a maze", errors.getvalue())
+        self.assertIn("empty.bin: not a maze", errors.getvalue())
+        self.assertIn("mazes.jsonl:3: not a maze", errors.getvalue())
+        self.assertIn("mazes.jsonl:4: not a maze", errors.getvalue())
+        self.assertIn("mazes.jsonl:5: not a maze", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
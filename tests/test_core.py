@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import unittest
+from core import Point, Cell
+
+
+# Test cases for the dependency-free maze model
+class TestCore(unittest.TestCase):
+
+    def test_point_is_a_value(self):
+        """
+        Test that points compare by value and cannot be changed.
+        """
+        p = Point(10, 20)
+        self.assertEqual(p, Point(10, 20))
+        with self.assertRaises(AttributeError):
+            p.x = 5
+
+    def test_cell_walls(self):
+        """
+        Test that a new cell has all walls standing and no per-instance dictionary.
+        """
+        cell = Cell()
+        self.assertTrue(cell.has_top_wall and cell.has_right_wall and cell.has_bottom_wall and cell.has_left_wall)
+        self.assertFalse(hasattr(cell, "__dict__"))
+
+    def test_headless_imports_skip_tkinter_and_pillow(self):
+        """
+        Test that the headless entry points can be imported and run without loading tkinter or Pillow.
+        """
+        code = (
+            "import sys, main, server\n"
+            "from core import Point\n"
+            "from maze import Maze\n"
+            "Maze(Point(0, 0), 5, 5, 10, 10).solve(0, 0)\n"
+            "print(sorted(name for name in ('graphics', 'tkinter', 'PIL') if name in sys.modules))\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        output = subprocess.run([sys.executable, "-c", code], cwd=repo_root,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+
+if __name__ == "__main__":
+    unittest.main()
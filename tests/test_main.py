@@ -0,0 +1,116 @@
+import json
+import os
+import tempfile
+import unittest
+from multiprocessing.pool import Pool
+from unittest.mock import Mock, patch
+from main import main, parse_args
+from maze import GENERATORS, SOLVERS
+from walls import unpack_walls, unpack_path, packed_size
+
+
+# Test cases for the command-line driver
+class TestMain(unittest.TestCase):
+
+    def test_parse_args_defaults(self):
+        """
+        Test that without arguments a single 12x16 maze is animated in a window, as before.
+        """
+        args = parse_args([])
+        self.assertEqual(args.sizes, [(12, 16)])
+        self.assertEqual(args.render, "tk")
+
+    def test_parse_args_rejects_tk_batches(self):
+        """
+        Test that the window can only show a single maze and that sizes must be ROWSxCOLS within the packed format's limits.
+        """
+        with self.assertRaises(SystemExit):
+            parse_args(["--count", "3"])
+        with self.assertRaises(SystemExit):
+            parse_args(["--size", "12by16", "--render", "none"])
+        # The packed format stores rows and columns in 16 bits
+        with self.assertRaises(SystemExit):
+            parse_args(["--size", "70000x1", "--render", "none"])
+
+    def test_batch_jsonl(self):
+        """
+        Test that a headless batch writes one JSON line per maze with its walls and solution.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            main(["--size", "4x5", "--size", "3x3", "--count", "2", "--seed", "10",
+                  "--render", "none", "--output-dir", output_dir])
+            with open(os.path.join(output_dir, "mazes.jsonl")) as jsonl_file:
+                records = [json.loads(line) for line in jsonl_file]
+
+        self.assertEqual(len(records), 4)
+        self.assertEqual(sorted(record["seed"] for record in records), [10, 11, 12, 13])
+        for record in records:
+            self.assertEqual(len(record["walls"]), record["rows"])
+            self.assertEqual(record["path"][0], [0, 0])
+            self.assertEqual(record["path"][-1], [record["cols"] - 1, record["rows"] - 1])
+
+    def test_batch_binary_with_workers(self):
+        """
+        Test that a batch run on worker processes writes one packed file per maze.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            main(["--size", "6x4", "--count", "3", "--render", "none", "--format", "binary",
+                  "--workers", "2", "--output-dir", output_dir])
+            file_names = sorted(os.listdir(output_dir))
+            with open(os.path.join(output_dir, file_names[0]), "rb") as binary_file:
+                data = binary_file.read()
+
+        self.assertEqual(file_names, ["maze_000000.bin", "maze_000001.bin", "maze_000002.bin"])
+        num_rows, num_cols, _ = unpack_walls(data)
+        self.assertEqual((num_rows, num_cols), (6, 4))
+        self.assertEqual(unpack_path(data, packed_size(6, 4))[-1], (3, 5))
+
+    def test_batch_png(self):
+        """
+        Test that the png render mode writes an image next to the results.
+        """
+        with tempfile.TemporaryDirectory() as output_dir:
+            main(["--size", "3x3", "--render", "png", "--output-dir", output_dir])
+            self.assertIn("maze_000000.png", os.listdir(output_dir))
+
+    def test_batch_stops_workers_when_writing_fails(self):
+        """
+        Test that a failure while writing results (a full disk, Ctrl+C) terminates the workers
+        instead of waiting for them to finish jobs whose results would be thrown away.
+        """
+        pools = []
+
+        def make_pool(*args, **kwargs):
+            pool = Pool(*args, **kwargs)
+            pool.close = Mock(wraps=pool.close)
+            pool.terminate = Mock(wraps=pool.terminate)
+            pools.append(pool)
+            return pool
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            with patch("main.Pool", side_effect=make_pool), \
+                 patch("main.walls_to_rows", side_effect=[[], OSError("No space left on device")]):
+                with self.assertRaises(OSError):
+                    main(["--size", "10x10", "--count", "200", "--render", "none",
+                          "--workers", "2", "--output-dir", output_dir])
+
+        self.assertEqual(len(pools), 1)
+        pools[0].terminate.assert_called_once()
+        pools[0].close.assert_not_called()
+
+    def test_batch_uses_selected_algorithms(self):
+        """
+        Test that the generator and solver named on the command line are the ones that run.
+        """
+        generator = Mock(wraps=GENERATORS["dfs"])
+        solver = Mock(wraps=SOLVERS["dfs"])
+        with tempfile.TemporaryDirectory() as output_dir:
+            with patch.dict("main.GENERATORS", {"dfs": generator}), patch.dict("main.SOLVERS", {"dfs": solver}):
+                main(["--size", "3x3", "--count", "2", "--generator", "dfs", "--solver", "dfs",
+                      "--render", "none", "--output-dir", output_dir])
+        self.assertEqual(generator.call_count, 2)
+        self.assertEqual(solver.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -29,13 +29,10 @@ class Tests(unittest.TestCase):
             False,
         )
 
-        # Checks if all cells "visited" are reset after breaking walls in maze
+        # Checks that breaking walls in the maze leaves no "visited" state behind on the cells
         for col in m1._cells:
             for cell in col:
-                self.assertEqual(
-                    cell.visited,
-                    False,
-                )
+                self.assertFalse(hasattr(cell, "visited"))
 
     def test_maze_create_cells_large(self):
         """
@@ -60,14 +57,54 @@ class Tests(unittest.TestCase):
             False,
         )
 
-        # Checks if all cells "visited" are reset after breaking walls in maze
+        # Checks that breaking walls in the maze leaves no "visited" state behind on the cells
         for col in m1._cells:
             for cell in col:
-                self.assertEqual(
-                    cell.visited,
-                    False,
-                )
+                self.assertFalse(hasattr(cell, "visited"))
 
+    def test_maze_find_path(self):
+        """
+        Test that find_path returns a connected path between two cells without walls in the way,
+        and that it works without a window (no drawing happens).
+        """
+        m1 = Maze(Point(0, 0), 6, 8, 10, 10, seed=3)
+        path = m1.find_path((0, 0), (7, 5))
+
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (7, 5))
+        # Every step moves to a neighbouring cell
+        for (i, j), (ni, nj) in zip(path, path[1:]):
+            self.assertEqual(abs(i - ni) + abs(j - nj), 1)
+
+        with self.assertRaises(ValueError):
+            m1.find_path((0, 0), (8, 0))
+
+    def test_maze_concurrent_solves(self):
+        """
+        Test that many threads can solve the same maze at once and all find the same path,
+        and that the animated solve does not disturb them.
+        """
+        import threading
+
+        m1 = Maze(Point(0, 0), 20, 20, 10, 10, seed=4)
+        expected = m1.find_path((0, 0), (19, 19))
+        results = []
+
+        def query():
+            for _ in range(20):
+                results.append(m1.find_path((0, 0), (19, 19)))
+
+        threads = [threading.Thread(target=query) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(m1.solve(0, 0))
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), 160)
+        self.assertTrue(all(path == expected for path in results))
+        # Solving twice needs no reset in between
+        self.assertTrue(m1.solve(0, 0))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+import http.client
+import json
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+from server import MazeServer, Batcher
+from walls import unpack_walls, packed_size, unpack_path
+
+
+# Test cases for the HTTP maze server
+class TestServer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Start one server with a small worker pool on a free port for all tests.
+        """
+        cls.server = MazeServer(("127.0.0.1", 0), workers=2, quiet=True)
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def get(self, path):
+        with urlopen(self.base_url + path) as response:
+            return response.headers["Content-Type"], response.read()
+
+    def test_generate_json(self):
+        """
+        Test that a seeded maze is returned as rows of wall masks, and that the same seed gives the same maze.
+        """
+        _, body = self.get("/generate?rows=4&cols=6&seed=7")
+        result = json.loads(body)
+        self.assertEqual(result["seed"], 7)
+        self.assertEqual(len(result["walls"]), 4)
+        self.assertEqual(len(result["walls"][0]), 6)
+
+        _, body_again = self.get("/generate?rows=4&cols=6&seed=7")
+        self.assertEqual(json.loads(body_again)["walls"], result["walls"])
+
+    def test_generate_binary(self):
+        """
+        Test that the binary format unpacks into a maze of the requested size.
+        """
+        content_type, body = self.get("/generate?rows=3&cols=5&seed=1&format=binary")
+        self.assertEqual(content_type, "application/octet-stream")
+        num_rows, num_cols, masks = unpack_walls(body)
+        self.assertEqual((num_rows, num_cols, len(masks)), (3, 5, 15))
+
+    def test_solve_post(self):
+        """
+        Test solving between two cells with a JSON body: the path must run from start to end.
+        """
+        request = Request(self.base_url + "/solve", method="POST",
+                          data=json.dumps({"rows": 5, "cols": 5, "seed": 3, "start": [1, 1], "end": [4, 0]}).encode())
+        with urlopen(request) as response:
+            result = json.loads(response.read())
+        self.assertEqual(result["path"][0], [1, 1])
+        self.assertEqual(result["path"][-1], [4, 0])
+
+    def test_solve_binary(self):
+        """
+        Test that the binary solve response carries the path after the packed maze.
+        """
+        _, body = self.get("/solve?rows=4&cols=4&seed=5&format=binary")
+        path = unpack_path(body, packed_size(4, 4))
+        self.assertEqual(path[0], (0, 0))
+        self.assertEqual(path[-1], (3, 3))
+
+    def test_concurrent_requests(self):
+        """
+        Test that many simultaneous requests are batched and all answered.
+        """
+        results = {}
+
+        def fetch(seed):
+            results[seed] = json.loads(self.get(f"/generate?rows=3&cols=3&seed={seed}")[1])["seed"]
+
+        threads = [threading.Thread(target=fetch, args=(seed,)) for seed in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, {seed: seed for seed in range(20)})
+
+    def test_bad_request(self):
+        """
+        Test that invalid parameters and unknown endpoints are rejected.
+        """
+        with self.assertRaises(HTTPError) as context:
+            self.get("/generate?rows=0&cols=3")
+        self.assertEqual(context.exception.code, 400)
+        with self.assertRaises(HTTPError) as context:
+            self.get("/generate?rows=3&cols=3&algorithm=prim")
+        self.assertEqual(context.exception.code, 400)
+        with self.assertRaises(HTTPError) as context:
+            self.get("/nothing")
+        self.assertEqual(context.exception.code, 404)
+
+    def test_non_integer_parameters(self):
+        """
+        Test that floats and booleans in a JSON body, and non-integer query values, are refused instead of truncated.
+        """
+        for params in ({"rows": 3.9, "cols": 3}, {"rows": 3, "cols": True}, {"rows": 3, "cols": 3, "seed": 1.5},
+                       {"rows": 3, "cols": 3, "start": [0, 0.5]}):
+            request = Request(self.base_url + "/solve", method="POST", data=json.dumps(params).encode())
+            with self.assertRaises(HTTPError) as context:
+                urlopen(request)
+            self.assertEqual(context.exception.code, 400)
+        with self.assertRaises(HTTPError) as context:
+            self.get("/generate?rows=3.9&cols=3")
+        self.assertEqual(context.exception.code, 400)
+
+    def test_bad_content_length(self):
+        """
+        Test that a POST with a missing-number or negative Content-Length is rejected instead of hanging.
+        """
+        for length in ("abc", "-1"):
+            connection = http.client.HTTPConnection("127.0.0.1", self.server.server_port, timeout=5)
+            connection.putrequest("POST", "/generate")
+            connection.putheader("Content-Length", length)
+            connection.endheaders()
+            response = connection.getresponse()
+            self.assertEqual(response.status, 400)
+            response.read()
+            connection.close()
+
+    def test_lost_job_times_out(self):
+        """
+        Test that a request whose job is lost by the pool (a worker died) fails with 503 instead of hanging.
+        """
+        batcher, timeout = self.server.batcher, self.server.request_timeout
+        # A pool that accepts jobs but never reports back, like one whose worker was killed
+        self.server.batcher = Batcher(Mock(), 1)
+        self.server.request_timeout = 0.2
+        try:
+            with self.assertRaises(HTTPError) as context:
+                self.get("/generate?rows=3&cols=3")
+            self.assertEqual(context.exception.code, 503)
+        finally:
+            self.server.batcher.close()
+            self.server.batcher, self.server.request_timeout = batcher, timeout
+
+
+# Test cases for the micro-batching of jobs
+class TestBatcher(unittest.TestCase):
+
+    def test_batch_is_spread_over_workers(self):
+        """
+        Test that a batch is split into one chunk per worker rather than run by a single worker.
+        """
+        mock_pool = Mock()
+        batcher = Batcher(mock_pool, workers=4, batch_window=0.2)
+        for n in range(8):
+            batcher.submit({"n": n})
+        time.sleep(0.4)
+        batcher.close()
+
+        chunks = [call.args[1][0] for call in mock_pool.apply_async.call_args_list]
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 2, 2, 2])
+        self.assertEqual([job["n"] for chunk in chunks for job in chunk], list(range(8)))
+
+
+if __name__ == "__main__":
+    unittest.main()
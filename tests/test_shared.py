@@ -0,0 +1,128 @@
+import multiprocessing
+import os
+import pickle
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+from multiprocessing import resource_tracker
+from core import Point
+from maze import Maze
+from shared import SharedMaze, MazeHandle
+from walls import pack_walls
+
+
+def _solve_attached(handle):
+    """Attaches to a shared maze in a worker process and solves it from entrance to exit."""
+    maze = handle.attach()
+    try:
+        return maze.find_path((0, 0), (handle.num_cols - 1, handle.num_rows - 1))
+    finally:
+        maze.close()
+
+
+# Test cases for mazes in shared memory
+class TestSharedMaze(unittest.TestCase):
+
+    def setUp(self):
+        self.maze = Maze(Point(0, 0), 15, 20, 10, 10, seed=8)
+        self.expected = self.maze.find_path((0, 0), (19, 14))
+
+    def test_attach_in_same_process(self):
+        """
+        Test that an attached view sees the walls of the owner without copying them, and solves the same.
+        """
+        with SharedMaze.from_maze(self.maze) as owner:
+            attached = owner.handle.attach()
+            self.assertFalse(attached.owner)
+            self.assertEqual(bytes(attached.walls), bytes(self.maze._walls))
+            self.assertEqual(attached.find_path((0, 0), (19, 14)), self.expected)
+
+            # A change made through the owner is visible through the view
+            owner.walls[0] = 0
+            self.assertEqual(attached.walls[0], 0)
+            attached.close()
+
+    def test_handle_is_small(self):
+        """
+        Test that the handle pickles to a few bytes, whatever the size of the maze.
+        """
+        with SharedMaze.create(300, 300) as owner:
+            handle = pickle.loads(pickle.dumps(owner.handle))
+            self.assertEqual(handle, MazeHandle(owner.handle.name, 300, 300))
+            self.assertLess(len(pickle.dumps(handle)), 200)
+
+    def test_worker_processes(self):
+        """
+        Test that worker processes, forked or spawned, can attach to the maze and solve it.
+        """
+        with SharedMaze.from_maze(self.maze) as owner:
+            for method in ("fork", "spawn"):
+                with multiprocessing.get_context(method).Pool(2) as pool:
+                    paths = pool.map(_solve_attached, [owner.handle] * 4)
+                self.assertTrue(all(path == self.expected for path in paths))
+            # The maze outlives the workers that attached to it
+            self.assertEqual(owner.find_path((0, 0), (19, 14)), self.expected)
+
+    def test_packed_round_trip(self):
+        """
+        Test moving between the compact binary format and shared memory.
+        """
+        packed = pack_walls(15, 20, self.maze._walls)
+        with SharedMaze.from_packed(packed) as owner:
+            self.assertEqual(owner.to_packed(), packed)
+
+    def test_only_owner_unlinks(self):
+        """
+        Test that attaching checks the size in the handle, and that only the owner may unlink.
+        """
+        with SharedMaze.create(2, 3) as owner:
+            with self.assertRaises(ValueError):
+                MazeHandle(owner.handle.name, 3, 2).attach()
+            attached = SharedMaze.attach(owner.handle.name)
+            with self.assertRaises(RuntimeError):
+                attached.unlink()
+            attached.close()
+
+    def test_attach_does_not_register(self):
+        """
+        Test that attaching never registers the segment with the resource tracker,
+        so workers sharing the owner's tracker cannot remove the owner's registration.
+        """
+        with SharedMaze.create(2, 2) as owner:
+            with patch.object(resource_tracker, "register") as register:
+                owner.handle.attach().close()
+            for call in register.call_args_list:
+                self.assertNotEqual(call.args[0].lstrip("/"), owner.handle.name.lstrip("/"))
+
+    def test_workers_leave_tracker_quiet(self):
+        """
+        Test that many workers attaching at once produce no resource tracker errors or leak warnings.
+        """
+        code = (
+            "import multiprocessing\n"
+            "from tests.test_shared import _solve_attached\n"
+            "from shared import SharedMaze\n"
+            "if __name__ == '__main__':\n"
+            "    with SharedMaze.create(10, 10) as owner:\n"
+            "        with multiprocessing.get_context('fork').Pool(4) as pool:\n"
+            "            pool.map(_solve_attached, [owner.handle] * 64, chunksize=1)\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, "-c", code], cwd=repo_root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertNotIn("KeyError", result.stderr)
+        self.assertNotIn("leaked", result.stderr)
+
+    def test_create_rejects_oversized_maze(self):
+        """
+        Test that a maze too large for the header is refused before any shared memory is allocated.
+        """
+        with patch("shared.shared_memory.SharedMemory") as allocate:
+            with self.assertRaises(ValueError):
+                SharedMaze.create(70000, 1)
+            allocate.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
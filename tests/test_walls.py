@@ -0,0 +1,70 @@
+import unittest
+from maze import Maze
+from core import Point
+from walls import (encode_walls, walls_to_rows, pack_walls, unpack_walls, packed_size,
+                   pack_path, unpack_path, find_path, WALL_TOP, WALL_BOTTOM)
+
+
+# Test cases for the wall encodings
+class TestWalls(unittest.TestCase):
+
+    def test_encode_walls(self):
+        """
+        Test that every cell gets one mask, stored row by row,
+        and that the entrance and exit walls are missing.
+        """
+        num_cols = 5
+        num_rows = 4
+        maze = Maze(Point(0, 0), num_rows, num_cols, 10, 10, seed=1)
+        masks = encode_walls(maze)
+
+        self.assertEqual(len(masks), num_rows * num_cols)
+        self.assertFalse(masks[0] & WALL_TOP)
+        self.assertFalse(masks[-1] & WALL_BOTTOM)
+
+        rows = walls_to_rows(num_rows, num_cols, masks)
+        self.assertEqual(len(rows), num_rows)
+        self.assertEqual(rows[1][2], masks[1 * num_cols + 2])
+
+    def test_pack_round_trip(self):
+        """
+        Test that packing and unpacking gives back the same masks, for an odd number of cells as well.
+        """
+        maze = Maze(Point(0, 0), 3, 5, 10, 10, seed=2)
+        masks = encode_walls(maze)
+        data = pack_walls(3, 5, masks)
+
+        self.assertEqual(len(data), packed_size(3, 5))
+        self.assertEqual(unpack_walls(data), (3, 5, masks))
+
+    def test_unpack_rejects_garbage(self):
+        """
+        Test that data which is not a packed maze is refused.
+        """
+        with self.assertRaises(ValueError):
+            unpack_walls(b"not a maze")
+
+    def test_path_round_trip(self):
+        """
+        Test that a packed path can be read back from behind a packed maze.
+        """
+        path = [(0, 0), (0, 1), (1, 1)]
+        data = pack_walls(1, 1, b"\x0f") + pack_path(path)
+        self.assertEqual(unpack_path(data, packed_size(1, 1)), path)
+
+    def test_find_path_on_masks(self):
+        """
+        Test searching directly on wall masks, including a read-only memoryview and cells that are not connected.
+        """
+        maze = Maze(Point(0, 0), 4, 4, 10, 10, seed=6)
+        masks = memoryview(bytes(encode_walls(maze)))
+        self.assertEqual(find_path(masks, 4, 4, (0, 0), (3, 3)), maze.find_path((0, 0), (3, 3)))
+
+        # Two cells with all walls standing cannot reach each other
+        self.assertEqual(find_path(b"\x0f\x0f", 1, 2, (0, 0), (1, 0)), [])
+        with self.assertRaises(ValueError):
+            find_path(masks, 4, 4, (0, 0), (4, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
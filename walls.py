@@ -0,0 +1,213 @@
+import struct
+
+# Bit flags describing which walls of a cell are standing
+WALL_TOP = 1
+WALL_RIGHT = 2
+WALL_BOTTOM = 4
+WALL_LEFT = 8
+
+# Header of the compact binary format: magic, version, number of rows, number of columns
+MAGIC = b"MZ"
+VERSION = 1
+_HEADER = struct.Struct(">2sBHH")
+# Largest number of rows or columns the header can hold
+MAX_DIMENSION = 0xFFFF
+_PATH_LENGTH = struct.Struct(">I")
+_PATH_STEP = struct.Struct(">HH")
+
+
+def cell_mask(cell) -> int:
+    """
+    Returns the wall bit mask of a single cell.
+
+    Args:
+        cell (Cell): The cell whose walls should be encoded.
+
+    Returns:
+        int: A combination of WALL_TOP, WALL_RIGHT, WALL_BOTTOM and WALL_LEFT.
+    """
+    mask = 0
+    if cell.has_top_wall:
+        mask |= WALL_TOP
+    if cell.has_right_wall:
+        mask |= WALL_RIGHT
+    if cell.has_bottom_wall:
+        mask |= WALL_BOTTOM
+    if cell.has_left_wall:
+        mask |= WALL_LEFT
+    return mask
+
+
+def encode_walls(maze) -> bytearray:
+    """
+    Encodes the walls of a maze as one bit mask per cell.
+
+    The masks are stored row by row, so the cell in column i and row j
+    is found at index j * num_cols + i.
+
+    Args:
+        maze (Maze): The maze to encode.
+
+    Returns:
+        bytearray: The wall masks of all cells.
+    """
+    masks = bytearray(maze._num_rows * maze._num_cols)
+    for i, col in enumerate(maze._cells):
+        for j, cell in enumerate(col):
+            masks[j * maze._num_cols + i] = cell_mask(cell)
+    return masks
+
+
+def walls_to_rows(num_rows: int, num_cols: int, masks) -> list:
+    """
+    Converts flat wall masks into a list of rows, the JSON wall format.
+
+    Args:
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        masks (bytes): The wall masks, row by row.
+
+    Returns:
+        list: One list of wall masks per row.
+    """
+    return [list(masks[j * num_cols:(j + 1) * num_cols]) for j in range(num_rows)]
+
+
+def pack_walls(num_rows: int, num_cols: int, masks) -> bytes:
+    """
+    Packs wall masks into the compact binary format.
+
+    The output starts with a header (magic, version, rows, columns) followed
+    by two cells per byte, the first cell in the high nibble.
+
+    Args:
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        masks (bytes): The wall masks, row by row.
+
+    Returns:
+        bytes: The packed maze.
+    """
+    num_cells = num_rows * num_cols
+    if len(masks) != num_cells:
+        raise ValueError(f"expected {num_cells} wall masks, got {len(masks)}")
+    body = bytearray((num_cells + 1) // 2)
+    for k in range(0, num_cells - 1, 2):
+        body[k // 2] = (masks[k] << 4) | masks[k + 1]
+    if num_cells % 2:
+        body[-1] = masks[-1] << 4
+    return _HEADER.pack(MAGIC, VERSION, num_rows, num_cols) + bytes(body)
+
+
+def unpack_walls(data: bytes) -> tuple:
+    """
+    Unpacks a maze stored in the compact binary format.
+
+    Args:
+        data (bytes): The packed maze, as produced by pack_walls. Trailing bytes are ignored.
+
+    Returns:
+        tuple: (num_rows, num_cols, masks) where masks is a bytearray with one mask per cell.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("data is too short to hold a maze header")
+    magic, version, num_rows, num_cols = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("data is not a packed maze")
+    if version != VERSION:
+        raise ValueError(f"unsupported maze format version {version}")
+    num_cells = num_rows * num_cols
+    body = data[_HEADER.size:_HEADER.size + (num_cells + 1) // 2]
+    if len(body) < (num_cells + 1) // 2:
+        raise ValueError("data is too short for the maze dimensions")
+    masks = bytearray(num_cells)
+    for k in range(num_cells):
+        byte = body[k // 2]
+        masks[k] = byte & 0x0F if k % 2 else byte >> 4
+    return num_rows, num_cols, masks
+
+
+def packed_size(num_rows: int, num_cols: int) -> int:
+    """Returns the number of bytes pack_walls produces for a maze of the given size."""
+    return _HEADER.size + (num_rows * num_cols + 1) // 2
+
+
+def pack_path(path: list) -> bytes:
+    """
+    Packs a path of (i, j) cell coordinates as a step count followed by the steps.
+
+    Args:
+        path (list): The cells of the path, in order.
+
+    Returns:
+        bytes: The packed path.
+    """
+    return _PATH_LENGTH.pack(len(path)) + b"".join(_PATH_STEP.pack(i, j) for i, j in path)
+
+
+def unpack_path(data: bytes, offset: int = 0) -> list:
+    """
+    Unpacks a path produced by pack_path.
+
+    Args:
+        data (bytes): The buffer holding the packed path.
+        offset (int, optional): Where the packed path starts in the buffer. Defaults to 0.
+
+    Returns:
+        list: The cells of the path as (i, j) tuples.
+    """
+    (length,) = _PATH_LENGTH.unpack_from(data, offset)
+    offset += _PATH_LENGTH.size
+    return [_PATH_STEP.unpack_from(data, offset + n * _PATH_STEP.size) for n in range(length)]
+
+
+def find_path(masks, num_rows: int, num_cols: int, start: tuple, end: tuple) -> list:
+    """
+    Finds the path between two cells using iterative depth-first search over wall masks.
+
+    The masks are only read and the visited state lives in a bytearray owned by this call,
+    so any number of searches can run at the same time on the same masks, for example
+    from several threads or from processes attached to the same shared memory.
+
+    Args:
+        masks (bytes): The wall masks, row by row. Any buffer works, including a memoryview.
+        num_rows (int): The number of rows in the maze.
+        num_cols (int): The number of columns in the maze.
+        start (tuple): The (i, j) coordinates of the first cell.
+        end (tuple): The (i, j) coordinates of the last cell.
+
+    Returns:
+        list: The (i, j) coordinates of every cell on the path, from start to end.
+              Empty if the cells are not connected.
+    """
+    for i, j in (start, end):
+        if not (0 <= i < num_cols and 0 <= j < num_rows):
+            raise ValueError(f"cell ({i}, {j}) is outside the maze")
+
+    goal = end[1] * num_cols + end[0]
+    visited = bytearray(num_rows * num_cols)
+    # The stack always holds the path from the start to the current cell
+    stack = [start[1] * num_cols + start[0]]
+    visited[stack[0]] = 1
+
+    while stack:
+        k = stack[-1]
+        if k == goal:
+            return [(cell % num_cols, cell // num_cols) for cell in stack]
+        mask = masks[k]
+        i, j = k % num_cols, k // num_cols
+        # Try the neighbours in the same order as Maze.solve: up, down, left, right
+        if j > 0 and not mask & WALL_TOP and not visited[k - num_cols]:
+            next_cell = k - num_cols
+        elif j < num_rows - 1 and not mask & WALL_BOTTOM and not visited[k + num_cols]:
+            next_cell = k + num_cols
+        elif i > 0 and not mask & WALL_LEFT and not visited[k - 1]:
+            next_cell = k - 1
+        elif i < num_cols - 1 and not mask & WALL_RIGHT and not visited[k + 1]:
+            next_cell = k + 1
+        else:
+            stack.pop()
+            continue
+        visited[next_cell] = 1
+        stack.append(next_cell)
+    return []